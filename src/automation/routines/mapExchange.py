@@ -3,6 +3,7 @@ from src.core.image_processing import find_all_templates, find_and_tap_template
 from src.game.controls import humanized_tap
 from src.core.logging import app_logger
 from typing import Optional
+import numpy as np
 
 class MapExchangeRoutine(TimeCheckRoutine):
 
@@ -74,12 +75,12 @@ class MapExchangeRoutine(TimeCheckRoutine):
                     "hidden_treasures_start_exchange"
                 )
             
-            if not exchange_locations:
+            if len(exchange_locations) == 0:
                 app_logger.debug("Could not find hidden_treasures_start_exchange button")
                 return True
 
             next_location = self.get_next_exchange_location(exchange_locations, ignore_locations)
-            if not next_location:
+            if next_location is None:
                 app_logger.debug("No more valid exchange locations")
                 return True
             
@@ -101,20 +102,20 @@ class MapExchangeRoutine(TimeCheckRoutine):
 
     def get_next_exchange_location(
         self, 
-        exchange_locations: list[tuple[int, int]], 
+        exchange_locations: np.ndarray, 
         ignore_locations: list[tuple[int, int]]
     ) -> Optional[tuple[int, int]]:
         """
         Get the first exchange location that's not in the ignored list
         
         Args:
-            exchange_locations: List of (x,y) coordinates for all exchange buttons
+            exchange_locations: (N, 2) array of (x,y) coordinates for all exchange buttons
             ignore_locations: List of (x,y) coordinates for already processed locations
             
         Returns:
             Tuple of (x,y) coordinates for next valid location, or None if no valid locations
         """
-        if not exchange_locations:
+        if len(exchange_locations) == 0:
             return None
         
         # Define proximity threshold (in pixels)
@@ -132,7 +133,7 @@ class MapExchangeRoutine(TimeCheckRoutine):
                 
             if not is_ignored:
                 app_logger.debug(f"Found next valid exchange location at: {location}")
-                return location
+                return tuple(int(v) for v in location)
             
         app_logger.debug("No more valid exchange locations found")
         return None
@@ -1,21 +1,48 @@
 import datetime
-from typing import Tuple
-import cv2
+from typing import Optional, Tuple
+import numpy as np
 from src.automation.routines.routineBase import TimeCheckRoutine
 from src.core.logging import app_logger
 from src.core.config import CONFIG
-from src.core.image_processing import find_template, find_all_templates, wait_for_image, find_and_tap_template
-from src.core.device import take_screenshot
+from src.core.image_processing import (
+    find_template,
+    find_all_templates,
+    find_all_templates_multi,
+    wait_for_image,
+    wait_for_screen_settle,
+    find_and_tap_template,
+    images_match,
+    get_template_size,
+    to_grayscale
+)
+from src.core.device import take_screenshot, take_screenshot_async
 from src.core.adb import get_screen_size, press_back
 from src.game.controls import human_delay, humanized_tap, handle_swipes
 from src.core.text_detection import (
     extract_text_from_region,
+    extract_texts_from_regions,
     get_text_regions,
     log_rejected_alliance,
-    CONTROL_LIST
+    ALLIANCE_WHITELIST
 )
 from src.core.audio import play_beep
 
+# Applicants handled per position on each run, the ones visible without scrolling
+MAX_APPLICANTS = 5
+
+# Maximum vertical distance, in pixels, between buttons of the same applicant row
+ROW_TOLERANCE = 10
+
+
+def _sort_top_to_bottom(matches: np.ndarray) -> np.ndarray:
+    """Sort (N, 2) coordinates by Y and then by X, both ascending"""
+    return matches[np.lexsort((matches[:, 0], matches[:, 1]))]
+
+
+def _topmost(matches: np.ndarray) -> np.ndarray:
+    """Return the match with the smallest Y as a (1, 2) array"""
+    return matches[[np.argmin(matches[:, 1])]]
+
 
 class SecretaryRoutine(TimeCheckRoutine):
     force_home: bool = True
@@ -24,12 +51,48 @@ class SecretaryRoutine(TimeCheckRoutine):
         super().__init__(device_id, interval, last_run, automation)
         self.secretary_types = ["strategy", "security", "development", "science", "interior"]
         self.additionalTypes = ["military", "administrative"]
+        self.all_types = tuple(self.secretary_types + self.additionalTypes)
         self.capture = None
         self.manual_deny = False
-        self.auto_remove = {position: {} for position in self.secretary_types + self.additionalTypes}
+        self.auto_remove = {position: {} for position in self.all_types}
 
         self.last_approve = {position: datetime.datetime.now()
-                             for position in self.secretary_types + self.additionalTypes}
+                             for position in self.all_types}
+
+        # Config values used in the processing loops
+        self._tap_delay = CONFIG['timings']['tap_delay']
+        self._settle_time = CONFIG['timings']['settle_time']
+        self._menu_animation = CONFIG['timings']['menu_animation']
+        self._list_timeout = CONFIG['timings']['list_timeout']
+        self._auto_remove_cfg = CONFIG.get('auto_remove', {})
+        self._applicant_offset = CONFIG.get("applicant_offset", {"x": 150, "y": 50})
+        self._max_retries = CONFIG.get('max_retries', 3)
+
+        # Where the reject confirmation dialog showed its button, learnt on first use
+        self._confirm_xy = None
+
+        # Screen size and profile button position never change for a device,
+        # resolved on first use so a failed adb call is retried next time
+        self._screen_size = None
+        self._profile_xy = None
+
+    def get_screen_size(self) -> Tuple[int, int]:
+        """Screen size of the device, cached once adb reported it"""
+        if self._screen_size is None:
+            # Raises when adb fails, so nothing is cached on errors
+            self._screen_size = get_screen_size(self.device_id)
+        return self._screen_size
+
+    def get_profile_xy(self) -> Tuple[int, int]:
+        """Tap position of the profile button"""
+        if self._profile_xy is None:
+            width, height = self.get_screen_size()
+            profile = CONFIG['ui_elements']['profile']
+            self._profile_xy = (
+                int(width * float(profile['x'].strip('%')) / 100),
+                int(height * float(profile['y'].strip('%')) / 100)
+            )
+        return self._profile_xy
 
     def _execute(self) -> bool:
         """Start secretary automation sequence"""
@@ -47,91 +110,114 @@ class SecretaryRoutine(TimeCheckRoutine):
         ):
             return False
         handle_swipes(self.device_id, direction="down", num_swipes=1)
-        human_delay(CONFIG['timings']['tap_delay'])
+        human_delay(self._tap_delay)
 
-        if CONFIG.get("auto_remove", {}) and CONFIG["auto_remove"].get("active", True):
+        if self._auto_remove_cfg and self._auto_remove_cfg.get("active", True):
             self.process_all_auto_remove_positions()
 
         return self.process_all_secretary_positions()
 
-    def find_accept_buttons(self) -> list[Tuple[int, int]]:
-        """Find all accept buttons on the screen and sort by Y coordinate"""
+    def find_accept_buttons(self, image: Optional[np.ndarray] = None, topmost_only: bool = False) -> np.ndarray:
+        """Find all accept buttons on the screen and sort by Y coordinate
+
+        With topmost_only, only the topmost button is returned, skipping the full sort.
+        """
         try:
             matches = find_all_templates(
                 self.device_id,
-                "accept"
+                "accept",
+                image=image
             )
-            if not matches:
-                return []
-
-            # Sort by Y coordinate (ascending) and X coordinate (ascending) for same Y
-            sorted_matches = sorted(matches, key=lambda x: (x[1], x[0]))
-            if sorted_matches:
-                app_logger.debug(f"Found {len(sorted_matches)} accept buttons")
-                app_logger.debug(f"Topmost button at coordinates: ({sorted_matches[0][0]}, {sorted_matches[0][1]})")
+            if len(matches) == 0:
+                return matches
+
+            app_logger.debug(f"Found {len(matches)} accept buttons")
+            sorted_matches = _topmost(matches) if topmost_only else _sort_top_to_bottom(matches)
+            app_logger.debug(f"Topmost button at coordinates: ({sorted_matches[0][0]}, {sorted_matches[0][1]})")
             return sorted_matches
 
         except Exception as e:
             app_logger.error(f"Error finding accept buttons: {e}")
-            return []
-
-    def find_reject_buttons(self) -> list[Tuple[int, int]]:
-        """Find all reject buttons on the screen and sort by Y coordinate"""
+            return np.empty((0, 2), dtype=np.int64)
+
+    def find_reject_buttons(
+            self,
+            image: Optional[np.ndarray] = None,
+            topmost_only: bool = False,
+            search_region: Optional[Tuple[int, int, int, int]] = None
+    ) -> np.ndarray:
+        """Find all reject buttons on the screen and sort by Y coordinate
+
+        With topmost_only, only the topmost button is returned, skipping the full sort.
+        search_region (x1, y1, x2, y2) restricts the search to part of the screen.
+        """
         try:
             matches = find_all_templates(
                 self.device_id,
-                "reject"
+                "reject",
+                search_region=search_region,
+                image=image
             )
-            if not matches:
-                return []
-
-            # Sort by Y coordinate (ascending) and X coordinate (ascending) for same Y
-            sorted_matches = sorted(matches, key=lambda x: (x[1], x[0]))
-            if sorted_matches:
-                app_logger.debug(f"Found {len(sorted_matches)} reject buttons")
-                app_logger.debug(f"Topmost button at coordinates: ({sorted_matches[0][0]}, {sorted_matches[0][1]})")
+            if len(matches) == 0:
+                return matches
+
+            app_logger.debug(f"Found {len(matches)} reject buttons")
+            sorted_matches = _topmost(matches) if topmost_only else _sort_top_to_bottom(matches)
+            app_logger.debug(f"Topmost button at coordinates: ({sorted_matches[0][0]}, {sorted_matches[0][1]})")
             return sorted_matches
 
         except Exception as e:
             app_logger.error(f"Error finding reject buttons: {e}")
-            return []
+            return np.empty((0, 2), dtype=np.int64)
 
     def open_profile_menu(self, device_id: str) -> bool:
         """Open the profile menu"""
         try:
-            width, height = get_screen_size(device_id)
-            profile = CONFIG['ui_elements']['profile']
-            profile_x = int(width * float(profile['x'].strip('%')) / 100)
-            profile_y = int(height * float(profile['y'].strip('%')) / 100)
-            humanized_tap(device_id, profile_x, profile_y)
+            humanized_tap(device_id, *self.get_profile_xy())
 
             # Look for notification indicators
             notification = wait_for_image(
                 device_id,
                 "awesome",
-                timeout=CONFIG['timings']['menu_animation'],
+                timeout=self._menu_animation,
             )
 
             if notification:
                 humanized_tap(device_id, notification[0], notification[1])
                 press_back(device_id)
-                human_delay(CONFIG['timings']['menu_animation'])
+                human_delay(self._menu_animation)
 
             return True
         except Exception as e:
             app_logger.error(f"Error opening profile menu: {e}")
             return False
 
-    def exit_to_secretary_menu(self) -> bool:
-        """Exit back to secretary menu"""
+    def exit_to_secretary_menu(self, image: Optional[np.ndarray] = None) -> bool:
+        """Exit back to secretary menu
+
+        Args:
+            image: Current screenshot, if the caller has one, used for the initial menu check
+        """
         try:
+            # Most of the time we are already there, so check once before pressing back
+            if self.verify_secretary_menu(image=image):
+                return True
+
             max_attempts = 10
             for _ in range(max_attempts):
-                if self.verify_secretary_menu():
-                    return True
-
                 press_back(self.device_id)
-                human_delay(CONFIG['timings']['menu_animation'])
+
+                # Poll with a doubling delay, never waiting longer than one menu animation
+                waited = 0
+                delay = self._menu_animation / 4
+                while True:
+                    human_delay(delay)
+                    waited += delay
+                    if self.verify_secretary_menu():
+                        return True
+                    if waited >= self._menu_animation:
+                        break
+                    delay = min(delay * 2, self._menu_animation - waited)
 
             app_logger.error("Failed to return to secretary menu")
             return False
@@ -140,32 +226,35 @@ class SecretaryRoutine(TimeCheckRoutine):
             app_logger.error(f"Error exiting to secretary menu: {e}")
             return False
 
-    def verify_secretary_menu(self) -> bool:
+    def verify_secretary_menu(self, image: Optional[np.ndarray] = None) -> bool:
         """Verify we're in the secretary menu"""
-        return wait_for_image(
-            self.device_id,
-            "president",
-            timeout=CONFIG['timings']['menu_animation']
-        ) is not None
-
-    def process_secretary_position(self, name: str) -> bool:
-        """Process a single secretary position"""
+        return find_template(self.device_id, "president", image=image) is not None
+
+    def process_secretary_position(self, name: str, location: Optional[Tuple[int, int]] = None) -> bool:
+        """Process a single secretary position
+
+        Args:
+            name: Secretary position type
+            location: Position coordinates already found on the secretary menu, searched if None
+        """
         try:
             # Find and click secretary position
             if not find_and_tap_template(
                     self.device_id,
                     name,
                     error_msg=f"Could not find {name} secretary position",
-                    critical=True
+                    critical=True,
+                    location=location
             ):
                 return True  # Continue with next position
 
-            human_delay(CONFIG['timings']['tap_delay'])
+            human_delay(self._tap_delay)
 
-            full_list = find_template(self.device_id, "full_list")
+            screenshot = take_screenshot(self.device_id)
+            full_list = find_template(self.device_id, "full_list", image=screenshot)
             if full_list:
                 app_logger.info(f"Auto-appointment list for {name} is already 50/50")
-                if not self.exit_to_secretary_menu():
+                if not self.exit_to_secretary_menu(image=screenshot):
                     app_logger.error("Failed to exit to secretary menu")
                     return False
 
@@ -177,101 +266,164 @@ class SecretaryRoutine(TimeCheckRoutine):
                     "list",
                     error_msg="List button not found",
                     critical=True,
-                    timeout=CONFIG['timings']['list_timeout']
+                    timeout=self._list_timeout
             ):
                 return False
 
             accept_locations = self.find_accept_buttons()
-            if accept_locations:
+            if len(accept_locations) > 0:
                 # Scroll to top if needed
-                if len(accept_locations) > 5:
+                settled_screenshot = None
+                if len(accept_locations) > MAX_APPLICANTS:
                     handle_swipes(self.device_id, direction="up")
-                    human_delay(CONFIG['timings']['settle_time'] * 2)
+                    settled_screenshot = wait_for_screen_settle(
+                        self.device_id,
+                        region=self.get_list_region(accept_locations),
+                        timeout=self._settle_time * 2
+                    )
 
                 processed = 0
                 accepted = 0
-
-                while processed < 5:  # Max 8 applicants
-                    if not take_screenshot(self.device_id):
-                        break
-
-                    current_screenshot = cv2.imread('tmp/screen.png')
-                    if current_screenshot is None:
+                failed_confirms = 0
+                # Never go past the applicants that were visible when the list opened
+                initial_count = min(len(accept_locations), MAX_APPLICANTS)
+
+                # OCR every visible applicant in one concurrent batch before tapping anything
+                batch_screenshot = None
+                applicant_alliances = []
+                next_capture = None
+                if ALLIANCE_WHITELIST:
+                    batch_screenshot = settled_screenshot
+                    if batch_screenshot is None:
+                        batch_screenshot = take_screenshot(self.device_id)
+                    if batch_screenshot is not None:
+                        # Nothing is tapped during the OCR, so the capture for the first iteration
+                        # is transferred meanwhile
+                        next_capture = take_screenshot_async(self.device_id)
+                        applicant_alliances = self.read_applicant_alliances(batch_screenshot, limit=initial_count)
+
+                # Next batch entry, only advanced when a tap removed the topmost applicant
+                batch_cursor = 0
+
+                while processed < initial_count:
+                    # One screenshot serves every read-only lookup of this iteration
+                    if next_capture is not None:
+                        self.capture = next_capture.result()
+                        next_capture = None
+                    else:
+                        self.capture = take_screenshot(self.device_id)
+                    if self.capture is None:
                         break
+                    current_screenshot = self.capture
+                    # Color is kept for OCR, template matching works on the grayscale copy
+                    current_gray = to_grayscale(current_screenshot)
 
-                    accept_locations = self.find_accept_buttons()
-                    if not accept_locations:
+                    accept_locations = self.find_accept_buttons(image=current_gray, topmost_only=True)
+                    if len(accept_locations) == 0:
                         break
 
                     topmost_accept = accept_locations[0]
 
-                    if len(CONTROL_LIST['whitelist']['alliance']) > 0:
+                    if ALLIANCE_WHITELIST:
 
+                        removed = False
+                        alliance_text = None
                         alliance_region, name_region, screenshot = get_text_regions(
                             topmost_accept,
                             self.device_id,
                             existing_screenshot=current_screenshot
                         )
 
-                        alliance_text, original_text = extract_text_from_region(
-                            self.device_id,
-                            alliance_region,
-                            languages='eng',
-                            img=screenshot
-                        )
+                        # Removed applicants leave the list, so the topmost one should be the next
+                        # batch entry. Its alliance crop is compared before trusting the batch text,
+                        # the list may not have shifted yet or a tap may have missed.
+                        if batch_cursor < len(applicant_alliances):
+                            batch_text, batch_original, _, batch_crop = applicant_alliances[batch_cursor]
+                            x1, y1, x2, y2 = alliance_region
+                            if images_match(batch_crop, screenshot[y1:y2, x1:x2]):
+                                alliance_text, original_text = batch_text, batch_original
+                            else:
+                                app_logger.debug("Topmost applicant is not the next batch entry, dropping the batch")
+                                applicant_alliances = []
+
+                        if alliance_text is None:
+                            alliance_text, original_text = extract_text_from_region(
+                                self.device_id,
+                                alliance_region,
+                                languages='eng',
+                                img=screenshot
+                            )
 
                         app_logger.debug(f"Found alliance is {alliance_text}")
 
-                        if alliance_text in CONTROL_LIST['whitelist']['alliance']:
+                        if alliance_text in ALLIANCE_WHITELIST:
                             humanized_tap(self.device_id, topmost_accept[0], topmost_accept[1])
                             app_logger.debug(
                                 f"Tapping accept at coordinates: ({topmost_accept[0]}, {topmost_accept[1]})")
                             app_logger.info(f"Accepted candidate with alliance: {alliance_text} for {name}")
                             accepted += 1
+                            removed = True
                         else:
                             # Handle rejection
                             app_logger.info(f"Rejecting candidate with alliance: {alliance_text} for {name}")
-                            log_rejected_alliance(alliance_text, original_text)
+                            log_rejected_alliance(alliance_text, original_text,
+                                                  screenshot=screenshot, region=alliance_region)
 
                             if self.manual_deny:
                                 play_beep()
                                 input('Press Enter to continue...')
 
-                            # Try reject button first
-                            reject_buttons = self.find_reject_buttons()
-                            if reject_buttons:
+                            # Try reject button first, it can only be on the same row as the accept button
+                            reject_buttons = self.find_reject_buttons(
+                                image=current_gray,
+                                topmost_only=True,
+                                search_region=self.get_row_region(current_gray, topmost_accept[1], "reject")
+                            )
+                            if len(reject_buttons) > 0:
                                 # Get topmost reject button
                                 reject_button = reject_buttons[0]
                                 # Verify it's aligned with our accept button vertically
-                                if abs(reject_button[1] - topmost_accept[1]) <= 10:  # 10 pixel tolerance
+                                if abs(reject_button[1] - topmost_accept[1]) <= ROW_TOLERANCE:
                                     humanized_tap(self.device_id, reject_button[0], reject_button[1])
                                     app_logger.debug(
                                         f"Tapping reject at coordinates: ({reject_button[0]}, {reject_button[1]})")
-                                    if not find_and_tap_template(
-                                            self.device_id,
-                                            "confirm",
-                                            error_msg="Failed to find confirm button",
-                                            critical=True
-                                    ):
+                                    if self.tap_confirm():
+                                        removed = True
+                                    else:
+                                        # The applicant may still be listed, the batch order is unreliable
+                                        applicant_alliances = []
+                                        failed_confirms += 1
+                                        if failed_confirms >= self._max_retries:
+                                            app_logger.error(f"Giving up on {name} after {failed_confirms} failed confirms")
+                                            break
                                         continue
                             else:
                                 # No reject buttons found, try confirm
-                                if find_and_tap_template(
-                                        self.device_id,
-                                        "confirm",
-                                        error_msg="Failed to find confirm button",
-                                        critical=True
-                                ):
+                                if self.tap_confirm():
                                     self.last_approve[name] = datetime.datetime.now()
                                 else:
+                                    applicant_alliances = []
+                                    failed_confirms += 1
+                                    if failed_confirms >= self._max_retries:
+                                        app_logger.error(f"Giving up on {name} after {failed_confirms} failed confirms")
+                                        break
                                     continue
+
+                        # Any other path may have left the applicant in the list, so the remaining
+                        # applicants are read one row at a time from now on
+                        if removed:
+                            batch_cursor += 1
+                        else:
+                            applicant_alliances = []
                     else:
                         # No whitelist - accept all
                         humanized_tap(self.device_id, topmost_accept[0], topmost_accept[1])
                         self.last_approve[name] = datetime.datetime.now()
 
                     processed += 1
-                    human_delay(CONFIG['timings']['settle_time'])
+                    failed_confirms = 0
+                    # The next iteration captures the list once it settled
+                    human_delay(self._settle_time)
 
             # Exit menus with verification
             if not self.exit_to_secretary_menu():
@@ -287,45 +439,145 @@ class SecretaryRoutine(TimeCheckRoutine):
                 return False
             return True
 
-    def process_remove_position(self, name: str) -> bool:
+    def tap_confirm(self) -> bool:
+        """Tap the confirm button of the reject dialog
+
+        The dialog always opens at the same place, so once its button has been found it is
+        only looked for in a small region around that point. The full screen is searched the
+        first time and whenever it is not found there.
+        """
+        location = None
+        if self._confirm_xy is not None:
+            template_size = get_template_size("confirm")
+            if template_size is not None:
+                template_w, template_h = template_size
+                x, y = self._confirm_xy
+                location = find_template(
+                    self.device_id,
+                    "confirm",
+                    search_region=(max(0, x - template_w), max(0, y - template_h), x + template_w, y + template_h)
+                )
+
+        if location is None:
+            location = find_template(self.device_id, "confirm")
+            if location is None:
+                app_logger.error("Failed to find confirm button")
+                return False
+            self._confirm_xy = location
+
+        humanized_tap(self.device_id, location[0], location[1])
+        return True
+
+    def get_list_region(self, accept_locations: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """Full height column covering the accept buttons of the applicant list"""
+        template_size = get_template_size("accept")
+        if template_size is None:
+            return None
+
+        try:
+            width, height = self.get_screen_size()
+        except RuntimeError as e:
+            # Settling on the full screen is slower but still correct
+            app_logger.error(f"Error getting list region: {e}")
+            return None
+
+        template_w = template_size[0]
+        return (
+            max(0, int(accept_locations[:, 0].min()) - template_w),
+            0,
+            min(width, int(accept_locations[:, 0].max()) + template_w),
+            height
+        )
+
+    @staticmethod
+    def get_row_region(image: np.ndarray, y: int, template_name: str) -> Optional[Tuple[int, int, int, int]]:
+        """Full width band where template_name can match with its center within ROW_TOLERANCE of y"""
+        template_size = get_template_size(template_name)
+        if template_size is None:
+            return None
+
+        template_h = template_size[1]
+        return (
+            0,
+            max(0, y - ROW_TOLERANCE - template_h // 2),
+            image.shape[1],
+            min(image.shape[0], y + ROW_TOLERANCE + template_h)
+        )
+
+    def read_applicant_alliances(
+            self,
+            image: np.ndarray,
+            limit: int = MAX_APPLICANTS
+    ) -> list[Tuple[str, str, Tuple[int, int, int, int], np.ndarray]]:
+        """OCR the alliance of the topmost applicants of the current list concurrently
+
+        Returns:
+            List of (alliance, original OCR text, alliance region, alliance crop), ordered from the
+            topmost applicant. The crop lets callers check an applicant is still the one read.
+        """
+        try:
+            accept_locations = self.find_accept_buttons(image=image)[:limit]
+            alliance_regions = [
+                get_text_regions(accept_location, self.device_id, existing_screenshot=image)[0]
+                for accept_location in accept_locations
+            ]
+            texts = extract_texts_from_regions(self.device_id, alliance_regions, languages='eng', img=image)
+            return [(alliance_text, original_text, (x1, y1, x2, y2), image[y1:y2, x1:x2])
+                    for (alliance_text, original_text), (x1, y1, x2, y2) in zip(texts, alliance_regions)]
+
+        except Exception as e:
+            app_logger.error(f"Error reading applicant alliances: {e}")
+            return []
+
+    def process_remove_position(self, name: str, location: Optional[Tuple[int, int]] = None) -> bool:
         try:
             if not find_and_tap_template(self.device_id,
                                          name,
                                          error_msg=f"Could not find {name} auto-remove position",
-                                         critical=True
+                                         critical=True,
+                                         location=location
                                          ):
                 return True  # Continue with next position
 
-            human_delay(CONFIG['timings']['tap_delay'])
+            human_delay(self._tap_delay)
+
+            # The read-only probes below share one capture, it is only retaken after a tap
+            screenshot = take_screenshot(self.device_id)
+            if screenshot is not None:
+                screenshot = to_grayscale(screenshot)
 
             # There is still people queued, so probably the 5 min timer is still running
-            if not find_template(self.device_id, "empty_list"):
+            if not find_template(self.device_id, "empty_list", image=screenshot):
                 app_logger.info(f"Players are still queued for position {name}")
                 self.last_approve[name] = datetime.datetime.now()
             else:
 
                 if find_template(self.device_id,
-                                 "appoint"):
+                                 "appoint",
+                                 image=screenshot):
                     if find_and_tap_template(self.device_id,
                                              "dismiss",
                                              error_msg=f"Impossible to find the dismiss button for position {name}",
-                                             critical=True):
+                                             critical=True,
+                                             image=screenshot):
 
-                        human_delay(CONFIG['timings']['tap_delay'])
+                        # The dismiss tap opened the confirmation dialog, the capture is outdated
+                        screenshot = None
+                        human_delay(self._tap_delay)
 
                         if find_and_tap_template(self.device_id,
                                                  "confirm-blue",
                                                  error_msg=f"Impossible to confirm dismiss for position {name}",
                                                 critical=True):
                             app_logger.info(f"Auto removed position {name}.")
-                            human_delay(CONFIG['timings']['tap_delay'])
+                            human_delay(self._tap_delay)
                             self.last_approve[name] = datetime.datetime.now()
 
                 else:
                     app_logger.info(f"Timer for current {name} a is not over yet.")
                     self.last_approve[name] = datetime.datetime.now()
 
-            if not self.exit_to_secretary_menu():
+            if not self.exit_to_secretary_menu(image=screenshot):
                 app_logger.error("Failed to exit to secretary menu after error")
                 return False
 
@@ -339,37 +591,40 @@ class SecretaryRoutine(TimeCheckRoutine):
         return True
 
 
-    def find_positions_with_applicants(self) -> list[str]:
-        """Find all secretary positions that have applicants"""
+    def find_positions_with_applicants(self) -> dict[str, Tuple[int, int]]:
+        """Find all secretary positions that have applicants, mapped to their location"""
         try:
-            positions_to_process = []
+            positions_to_process = {}
+
+            screenshot = take_screenshot(self.device_id)
+            if screenshot is None:
+                return {}
+
+            # Find all secretary positions and applicant icons in a single pass
+            found = find_all_templates_multi(
+                self.device_id,
+                self.all_types + ("has_applicant",),
+                image=screenshot
+            )
 
-            # Find all secretary positions
             all_positions = {}
-            secretary_types = self.secretary_types + self.additionalTypes
-            for position_type in secretary_types:
-                positions = find_all_templates(
-                    self.device_id,
-                    position_type
-                )
-                if positions:
+            for position_type in self.all_types:
+                positions = found[position_type]
+                if len(positions) > 0:
                     all_positions[position_type] = positions[0]  # Take first match for each type
                     app_logger.debug(f"Found {position_type} position at ({positions[0][0]}, {positions[0][1]})")
-            # Find all applicant icons
-            applicant_locations = find_all_templates(
-                self.device_id,
-                "has_applicant"
-            )
 
-            if not applicant_locations:
+            applicant_locations = found["has_applicant"]
+
+            if len(applicant_locations) == 0:
                 app_logger.debug("No applicant icons found")
-                return []
+                return {}
 
             app_logger.debug(f"Found {len(applicant_locations)} applicant icons:")
             for i, (x, y) in enumerate(applicant_locations):
                 app_logger.debug(f"  Applicant {i + 1}: ({x}, {y})")
 
-            applicant_offset = CONFIG.get("applicant_offset", {"x": 150, "y": 50})
+            applicant_offset = self._applicant_offset
 
             # For each position, check if there's an applicant icon nearby
             for position_type, pos_loc in all_positions.items():
@@ -381,7 +636,7 @@ class SecretaryRoutine(TimeCheckRoutine):
                     y_diff = abs(app_y - pos_y)
                     # Check if applicant icon is within 150 pixels horizontally and 50 pixels vertically
                     if x_diff <= applicant_offset["x"] and y_diff <= applicant_offset["y"]:
-                        positions_to_process.append(position_type)
+                        positions_to_process[position_type] = pos_loc
                         app_logger.info(f"Found applicant for {position_type} position with offset {x_diff=} {y_diff=}")
                         break
 
@@ -389,25 +644,24 @@ class SecretaryRoutine(TimeCheckRoutine):
 
         except Exception as e:
             app_logger.error(f"Error finding positions with applicants: {e}")
-            return []
+            return {}
 
-    def find_positions_to_remove(self) -> list[str]:
+    def find_positions_to_remove(self) -> dict[str, Tuple[int, int]]:
 
-        positions_to_remove = []
+        positions_to_remove = {}
 
-        auto_remove_config = CONFIG.get('auto_remove', False)
+        auto_remove_config = self._auto_remove_cfg
         if not auto_remove_config:
-            return []
+            return {}
 
         try:
-            secretary_types = self.secretary_types + self.additionalTypes
-
             title_cfg = auto_remove_config.get("title_cfg", {})
             if not title_cfg:
-                return []
+                return {}
 
-            # We check for vacant positions
-            for position_type in secretary_types:
+            # Only positions past their auto removal time need to be checked
+            due_types = []
+            for position_type in self.all_types:
 
                # We check if a configuration is present in config.json
                 auto_remove_delay = title_cfg.get(position_type, None)
@@ -420,21 +674,39 @@ class SecretaryRoutine(TimeCheckRoutine):
                 if approve_td < config_td:
                     continue
 
+                due_types.append(position_type)
+
+            if not due_types:
+                return {}
+
+            screenshot = take_screenshot(self.device_id)
+            if screenshot is None:
+                return {}
+
+            # Vacant and position cues of every due position, all matched in a single pass
+            found = find_all_templates_multi(
+                self.device_id,
+                [f"vacant-{position_type}" for position_type in due_types] + due_types,
+                image=screenshot
+            )
+
+            for position_type in due_types:
+
                 # we check if the position is vacant
-                if find_template(self.device_id, f"vacant-{position_type}"):
+                if len(found[f"vacant-{position_type}"]) > 0:
                     app_logger.info(f"{position_type} is vacant.")
                     self.last_approve[position_type] = datetime.datetime.now()
                     continue
 
                 # we check if we can find the position graphic cue
-                position = find_template(self.device_id, position_type)
-                if position:
+                positions = found[position_type]
+                if len(positions) > 0:
                     app_logger.debug(f"Position that require remove check: {position_type}")
-                    positions_to_remove.append(position_type)
+                    positions_to_remove[position_type] = positions[0]
 
         except Exception as e:
             app_logger.error(f"Error finding positions with applicants: {e}")
-            return []
+            return {}
 
         return positions_to_remove
 
@@ -444,10 +716,10 @@ class SecretaryRoutine(TimeCheckRoutine):
         if not positions_to_remove:
             app_logger.info("No auto-remove positions found.")
         else:
-            app_logger.info(f"Auto-remove positions {positions_to_remove=}")
+            app_logger.info(f"Auto-remove positions {list(positions_to_remove)}")
 
-        for position_type in positions_to_remove:
-            if not self.process_remove_position(position_type):
+        for position_type, location in positions_to_remove.items():
+            if not self.process_remove_position(position_type, location):
                 return False
 
         return True
@@ -468,7 +740,7 @@ class SecretaryRoutine(TimeCheckRoutine):
             ):
                 raise RuntimeError('secretary not accessible')
 
-            human_delay(CONFIG['timings']['tap_delay'])
+            human_delay(self._tap_delay)
 
             # Find list button
             if not find_template(
@@ -479,7 +751,7 @@ class SecretaryRoutine(TimeCheckRoutine):
 
             return True
 
-        for name in positions_to_process:
-            if not self.process_secretary_position(name):
+        for name, location in positions_to_process.items():
+            if not self.process_secretary_position(name, location):
                 return False
         return True
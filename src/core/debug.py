@@ -1,18 +1,24 @@
 import cv2
-from typing import Tuple
+import numpy as np
+from typing import Optional, Tuple
 from .logging import app_logger
 from .image_processing import _take_and_load_screenshot
 
-def save_debug_region(device_id: str, region: Tuple[int, int, int, int], prefix: str):
+def save_debug_region(device_id: str, region: Tuple[int, int, int, int], prefix: str,
+                      img: Optional[np.ndarray] = None):
     """Helper function to save debug images with region highlighting
     
     Args:
         device_id: Device identifier
         region: Tuple of (x1, y1, x2, y2) coordinates
         prefix: Prefix for saved debug image filenames
+        img: Already captured screenshot, a new one is taken if None
     """
     try:
-        img = _take_and_load_screenshot(device_id)
+        if img is None:
+            img = _take_and_load_screenshot(device_id)
+        else:
+            img = img.copy()
         if img is None:
             return
             
@@ -1,40 +1,98 @@
 """Device interaction utilities"""
 
+import struct
 import subprocess
-from typing import Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
 
 from .logging import app_logger
 from pathlib import Path
 import shutil
 from src.core.config import CONFIG
 
-def take_screenshot(device_id: str) -> bool:
-    """Take screenshot and pull to local tmp directory"""
+# screencap pixel formats (android.graphics.PixelFormat): bytes per pixel and conversion to BGR
+_SCREENCAP_FORMATS = {
+    1: (4, cv2.COLOR_RGBA2BGR),  # RGBA_8888
+    2: (4, cv2.COLOR_RGBA2BGR),  # RGBX_8888
+    3: (3, cv2.COLOR_RGB2BGR),  # RGB_888
+    4: (2, cv2.COLOR_BGR5652BGR),  # RGB_565
+    5: (4, cv2.COLOR_BGRA2BGR),  # BGRA_8888
+}
+
+# Single worker, background captures never compete with each other for the adb transport
+_CAPTURE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screencap")
+
+def take_screenshot(device_id: str) -> Optional[np.ndarray]:
+    """Capture the device framebuffer and return it as a BGR image
+
+    The raw framebuffer is streamed with `screencap` (no `-p`), which skips the
+    PNG encode on the device, the temporary file and the PNG decode on our side.
+    Framebuffers that can't be decoded fall back to a PNG capture.
+    """
     try:
+        # Debug images are still written to tmp
         ensure_dir("tmp")
 
-        # pipe = subprocess.Popen(f"{CONFIG.adb["binary_path"]} exec-out screencap -p",
-        #                         stdin=subprocess.PIPE,
-        #                         stdout=subprocess.PIPE, shell=True)
-        # image_bytes = pipe.stdout.read()  # .replace(b'\r\n', b'\n')
-        # image = cv2.imdecode(np.fromstring(image_bytes, np.uint8), cv2.IMREAD_COLOR)
-        #
-        # cv2.imwrite("tmp/screen.png", image)
-
-        cmd = [CONFIG.adb["binary_path"], "exec-out", "screencap","-p"]
-        with open('tmp/screen.png', "w") as outfile:
-            result =  subprocess.run(cmd, stdout=outfile)
-            if result.returncode != 0:
-                app_logger.error(f"Failed to pull screenshot: {result.stderr}")
-                return False
-            
-        # Clean up device screenshots
-        cleanup_device_screenshots(device_id)
-        return True
-        
+        cmd = [CONFIG.adb["binary_path"], "-s", device_id, "exec-out", "screencap"]
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode != 0:
+            app_logger.error(f"Failed to capture screenshot: {result.stderr}")
+            return None
+
+        img = _decode_raw_screencap(result.stdout)
+        if img is not None:
+            return img
+
+        app_logger.warning("Falling back to PNG screenshot")
+        result = subprocess.run(cmd + ["-p"], capture_output=True)
+        if result.returncode != 0:
+            app_logger.error(f"Failed to capture PNG screenshot: {result.stderr}")
+            return None
+
+        img = cv2.imdecode(np.frombuffer(result.stdout, np.uint8), cv2.IMREAD_COLOR)
+        if img is None:
+            app_logger.error("Failed to decode PNG screenshot")
+        return img
+
     except Exception as e:
         app_logger.error(f"Error taking screenshot: {e}")
-        return False
+        return None
+
+def take_screenshot_async(device_id: str) -> Future:
+    """Start take_screenshot in the background
+
+    The capture runs while the caller keeps going (e.g. waiting for an animation),
+    call result() on the returned Future to get the screenshot.
+    """
+    return _CAPTURE_EXECUTOR.submit(take_screenshot, device_id)
+
+def _decode_raw_screencap(data: bytes) -> Optional[np.ndarray]:
+    """Convert raw screencap output to a BGR image
+
+    The header is width, height and pixel format as little endian uint32, followed
+    on Android 9+ by a fourth uint32 with the color space.
+    """
+    if len(data) < 12:
+        app_logger.error(f"Screenshot data too short: {len(data)} bytes")
+        return None
+
+    width, height, pixel_format = struct.unpack_from('<III', data)
+    if pixel_format not in _SCREENCAP_FORMATS:
+        app_logger.error(f"Unsupported screenshot pixel format: {pixel_format}")
+        return None
+
+    bytes_per_pixel, conversion = _SCREENCAP_FORMATS[pixel_format]
+    pixels_size = width * height * bytes_per_pixel
+    header_size = 16 if len(data) >= 16 + pixels_size else 12
+    if len(data) < header_size + pixels_size:
+        app_logger.error(f"Truncated screenshot: expected {pixels_size} bytes of pixels for {width}x{height}")
+        return None
+
+    pixels = np.frombuffer(data, np.uint8, count=pixels_size, offset=header_size)
+    return cv2.cvtColor(pixels.reshape(height, width, bytes_per_pixel), conversion)
 
 def get_screen_size(device_id: str) -> Tuple[int, int]:
     """Get screen size from device"""
@@ -3,15 +3,48 @@
 import cv2
 import numpy as np
 import time
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 from pathlib import Path
 from .logging import app_logger
 from .device import take_screenshot
 from .config import CONFIG
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared pool for independent template searches on the same screenshot
+_MATCH_EXECUTOR = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="template-match")
+
+# Two level pyramid matching: candidates are found on half resolution images and refined at full resolution
+PYRAMID_MIN_TEMPLATE_SIZE = 24  # smaller templates lose too much detail when downscaled
+PYRAMID_THRESHOLD_MARGIN = 0.2  # coarse matches are less precise, so accept them with a looser threshold
+PYRAMID_REFINE_RADIUS = 4  # full resolution pixels searched around each coarse candidate
+
+# Decoded templates and their config by template name, filled at import by _preload_templates
+_TEMPLATE_CACHE: Dict[str, Tuple[np.ndarray, dict]] = {}
 
 def _load_template(template_name: str) -> Tuple[Optional[np.ndarray], Optional[dict]]:
-    """Load template and its config"""
+    """Load template and its config, decoding each template file only once"""
+    cached = _TEMPLATE_CACHE.get(template_name)
+    if cached is not None:
+        return cached
+
+    template, template_config = _read_template(template_name)
+    if template is None:
+        return None, None
+
+    # Cached arrays are shared by every caller, so protect them from in-place changes
+    template.setflags(write=False)
+    _TEMPLATE_CACHE[template_name] = (template, template_config)
+    return template, template_config
+
+def _preload_templates() -> None:
+    """Decode every template declared in config"""
+    for template_name, template_config in CONFIG['templates'].items():
+        if isinstance(template_config, dict):
+            _load_template(template_name)
+
+def _read_template(template_name: str) -> Tuple[Optional[np.ndarray], Optional[dict]]:
+    """Read template and its config from disk"""
     template_device = CONFIG['templates'].get('device', 'default')
 
     template_config = CONFIG['templates'].get(template_name)
@@ -32,31 +65,58 @@ def _load_template(template_name: str) -> Tuple[Optional[np.ndarray], Optional[d
             app_logger.error(f'Template {template_name} not found in default device')
             return None, None
 
-    template = cv2.imread(template_device_path)
+    # Matching only needs luminance, see to_grayscale
+    template = cv2.imread(template_device_path, cv2.IMREAD_GRAYSCALE)
     if template is None:
         app_logger.error(f"Failed to load template: {template_device_path}")
         return None, None
         
     return template, template_config
 
+_preload_templates()
+
+def get_template_size(template_name: str) -> Optional[Tuple[int, int]]:
+    """Get the (width, height) of a template, or None if it can't be loaded"""
+    template, _ = _load_template(template_name)
+    if template is None:
+        return None
+    template_h, template_w = template.shape[:2]
+    return template_w, template_h
+
+def to_grayscale(img: np.ndarray) -> np.ndarray:
+    """Convert a BGR screenshot to grayscale, grayscale images are returned as is
+
+    Templates are matched in grayscale: one byte per pixel instead of three for the
+    same TM_CCOEFF_NORMED search. Callers matching several times on one screenshot
+    can convert it once and pass the result around.
+    """
+    if img.ndim == 2:
+        return img
+    return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+
 def _take_and_load_screenshot(device_id: str) -> Optional[np.ndarray]:
     """Take and load a screenshot"""
-    if not take_screenshot(device_id):
-        app_logger.error("Failed to take screenshot")
-        return None
-        
-    img = cv2.imread('tmp/screen.png')
+    img = take_screenshot(device_id)
     if img is None:
-        app_logger.error("Failed to load screenshot")
+        app_logger.error("Failed to take screenshot")
         return None
         
     return img
 
 def find_template(
     device_id: str,
-    template_name: str
+    template_name: str,
+    image: Optional[np.ndarray] = None,
+    search_region: Tuple[int, int, int, int] = None
 ) -> Optional[Tuple[int, int]]:
-    """Find template in image and return center coordinates"""
+    """Find template in image and return center coordinates
+
+    Args:
+        device_id: Device identifier
+        template_name: Name of the template in config
+        image: Already captured screenshot to search, a new one is taken if None
+        search_region: Optional (x1, y1, x2, y2) region to restrict the search to
+    """
     try:
         app_logger.debug(f"Looking for template: {template_name}")
         
@@ -67,24 +127,28 @@ def find_template(
             
         app_logger.debug(f"Template loaded successfully. Shape: {template.shape}")
         
-        # Take screenshot first
-        if not take_screenshot(device_id):
-            app_logger.error("Failed to take screenshot")
-            return None
-            
-        img = cv2.imread('tmp/screen.png')
+        # Take screenshot first, unless the caller already has one
+        img = image if image is not None else _take_and_load_screenshot(device_id)
         if img is None:
-            app_logger.debug("Failed to load screenshot")
             return None
             
         app_logger.debug(f"Screenshot loaded successfully. Shape: {img.shape}")
         
         # Match template
-        result = cv2.matchTemplate(img, template, cv2.TM_CCOEFF_NORMED)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-        
         # Get threshold from template config or use default
         threshold = template_config.get('threshold', CONFIG['match_threshold'])
+
+        # Get region to search
+        if search_region:
+            x1, y1, x2, y2 = search_region
+            img_region = img[y1:y2, x1:x2]
+        else:
+            x1, y1 = 0, 0
+            img_region = img
+
+        result = _match_template(to_grayscale(img_region), template, threshold)
+        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+        max_loc = (max_loc[0] + x1, max_loc[1] + y1)
         app_logger.debug(f"Match values - Max: {max_val:.4f}, Min: {min_val:.4f}, Threshold: {threshold}")
         app_logger.debug(f"Match location - Max: {max_loc}, Min: {min_loc}")
         
@@ -96,7 +160,7 @@ def find_template(
         app_logger.debug(f"Match value {max_val:.4f} EXCEEDS threshold {threshold} !")
         
         # Save debug image
-        debug_img = img.copy()
+        debug_img = _to_debug_image(img)
         h, w = template.shape[:2]
         cv2.rectangle(debug_img, max_loc, (max_loc[0] + w, max_loc[1] + h), (0, 255, 0), 2)
         cv2.putText(debug_img, f"{max_val:.3f}", (max_loc[0], max_loc[1] - 5),
@@ -117,19 +181,27 @@ def find_template(
 def find_all_templates(
     device_id: str,
     template_name: str,
-    search_region: Tuple[int, int, int, int] = None
-) -> list[Tuple[int, int]]:
-    """Find all template matches in image and return center coordinates"""
+    search_region: Tuple[int, int, int, int] = None,
+    image: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Find all template matches in image and return center coordinates as an (N, 2) array
+
+    Args:
+        device_id: Device identifier
+        template_name: Name of the template in config
+        search_region: Optional (x1, y1, x2, y2) region to restrict the search to
+        image: Already captured screenshot to search, a new one is taken if None
+    """
     try:
         template, template_config = _load_template(template_name)
         if template is None:
-            return []
+            return _no_matches()
             
         h, w = template.shape[:2]
         
-        img = _take_and_load_screenshot(device_id)
+        img = image if image is not None else _take_and_load_screenshot(device_id)
         if img is None:
-            return []
+            return _no_matches()
             
         # Get region to search
         if search_region:
@@ -138,36 +210,13 @@ def find_all_templates(
         else:
             img_region = img
             
-        result = cv2.matchTemplate(img_region, template, cv2.TM_CCOEFF_NORMED)
         threshold = template_config.get('threshold', CONFIG['match_threshold'])
-            
-        matches = []
-        result_copy = result.copy()
-        
-        while True:
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result_copy)
-            if max_val < threshold:
-                break
-                
-            # Store match with confidence
-            center_x = max_loc[0] + w//2
-            center_y = max_loc[1] + h//2
-            matches.append((center_x, center_y, max_val))
-            
-            # Suppress region
-            x1_sup = max(0, max_loc[0] - w//2)
-            y1_sup = max(0, max_loc[1] - h//2)
-            x2_sup = min(result_copy.shape[1], max_loc[0] + w//2)
-            y2_sup = min(result_copy.shape[0], max_loc[1] + h//2)
-            result_copy[y1_sup:y2_sup, x1_sup:x2_sup] = 0
+        matches = _match_all(to_grayscale(img_region), template, threshold)
         
         # Adjust coordinates if search region was used
-        adjusted_matches = []
-        for x, y, conf in matches:
-            if search_region:
-                x += search_region[0]
-                y += search_region[1]
-            adjusted_matches.append((x, y))
+        adjusted_matches = _to_coordinates(matches)
+        if search_region:
+            adjusted_matches += search_region[:2]
             
         # Save debug image
         _save_debug_image(img, template_config['path'], matches, search_region, (w, h))
@@ -177,8 +226,137 @@ def find_all_templates(
         
     except Exception as e:
         app_logger.error(f"Error finding templates: {e}")
-        return []
+        return _no_matches()
     
+def find_all_templates_multi(
+    device_id: str,
+    template_names: Iterable[str],
+    image: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """Find all matches for several templates in a single screenshot
+
+    The screenshot is captured and converted to grayscale once and then shared by every template,
+    instead of paying a capture per template as repeated find_all_templates calls would.
+    Templates are matched concurrently on a shared thread pool.
+
+    Args:
+        device_id: Device identifier
+        template_names: Names of the templates in config
+        image: Already captured screenshot to search, a new one is taken if None
+
+    Returns:
+        Dictionary mapping each template name to an (N, 2) array of center coordinates
+    """
+    template_names = list(template_names)
+    results = {template_name: _no_matches() for template_name in template_names}
+    try:
+        img = image if image is not None else _take_and_load_screenshot(device_id)
+        if img is None:
+            return results
+        gray = to_grayscale(img)
+
+        def _find(template_name: str) -> np.ndarray:
+            template, template_config = _load_template(template_name)
+            if template is None:
+                return _no_matches()
+
+            h, w = template.shape[:2]
+            threshold = template_config.get('threshold', CONFIG['match_threshold'])
+            matches = _match_all(gray, template, threshold)
+            _save_debug_image(img, template_config['path'], matches, None, (w, h))
+
+            app_logger.debug(f"Found {len(matches)} matches for {template_name} with threshold {threshold}")
+            return _to_coordinates(matches)
+
+        # OpenCV releases the GIL while matching, so templates are searched in parallel
+        futures = {template_name: _MATCH_EXECUTOR.submit(_find, template_name) for template_name in template_names}
+        for template_name, future in futures.items():
+            results[template_name] = future.result()
+
+        return results
+
+    except Exception as e:
+        app_logger.error(f"Error finding templates: {e}")
+        return results
+
+def _no_matches() -> np.ndarray:
+    """Empty (0, 2) coordinates array"""
+    return np.empty((0, 2), dtype=np.int64)
+
+def _to_coordinates(matches: list[Tuple[int, int, float]]) -> np.ndarray:
+    """Drop confidences from _match_all results and return an (N, 2) coordinates array"""
+    if not matches:
+        return _no_matches()
+    return np.array([(x, y) for x, y, conf in matches], dtype=np.int64)
+
+def _match_all(
+    img: np.ndarray,
+    template: np.ndarray,
+    threshold: float
+) -> list[Tuple[int, int, float]]:
+    """Match template in image and return every match above threshold as (x, y, confidence)
+
+    Matches are returned by descending confidence, overlapping matches are suppressed.
+    """
+    h, w = template.shape[:2]
+    result = _match_template(img, template, threshold)
+
+    matches = []
+    while True:
+        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+        if max_val < threshold:
+            break
+
+        # Store match with confidence
+        center_x = max_loc[0] + w//2
+        center_y = max_loc[1] + h//2
+        matches.append((center_x, center_y, max_val))
+
+        # Suppress region
+        x1_sup = max(0, max_loc[0] - w//2)
+        y1_sup = max(0, max_loc[1] - h//2)
+        x2_sup = min(result.shape[1], max_loc[0] + w//2)
+        y2_sup = min(result.shape[0], max_loc[1] + h//2)
+        result[y1_sup:y2_sup, x1_sup:x2_sup] = 0
+
+    return matches
+
+def _match_template(img: np.ndarray, template: np.ndarray, threshold: float) -> np.ndarray:
+    """Compute the TM_CCOEFF_NORMED response map of template over img
+
+    Large enough templates are first matched on a pyrDown copy of both images, then the
+    response is only computed at full resolution around the coarse candidates. Every
+    other position is set to -1, so callers can threshold the map as usual.
+    """
+    th, tw = template.shape[:2]
+    result_h, result_w = img.shape[0] - th + 1, img.shape[1] - tw + 1
+    if min(th, tw) < PYRAMID_MIN_TEMPLATE_SIZE or min(result_h, result_w) < 4 * PYRAMID_REFINE_RADIUS:
+        return cv2.matchTemplate(img, template, cv2.TM_CCOEFF_NORMED)
+
+    coarse = cv2.matchTemplate(cv2.pyrDown(img), cv2.pyrDown(template), cv2.TM_CCOEFF_NORMED)
+    candidates = (coarse >= threshold - PYRAMID_THRESHOLD_MARGIN).astype(np.uint8)
+
+    # Each connected group of candidates becomes one full resolution search window
+    _, _, stats, _ = cv2.connectedComponentsWithStats(candidates)
+    windows = []
+    for x, y, w, h, _ in stats[1:]:
+        x1 = max(0, 2 * x - PYRAMID_REFINE_RADIUS)
+        y1 = max(0, 2 * y - PYRAMID_REFINE_RADIUS)
+        x2 = min(result_w, 2 * (x + w) + PYRAMID_REFINE_RADIUS)
+        y2 = min(result_h, 2 * (y + h) + PYRAMID_REFINE_RADIUS)
+        windows.append((x1, y1, x2, y2))
+
+    # Too many candidates, refining would cost more than a plain full resolution match
+    if sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in windows) > result_h * result_w // 2:
+        return cv2.matchTemplate(img, template, cv2.TM_CCOEFF_NORMED)
+
+    result = np.full((result_h, result_w), -1, dtype=np.float32)
+    for x1, y1, x2, y2 in windows:
+        roi = img[y1:y2 + th - 1, x1:x2 + tw - 1]
+        result[y1:y2, x1:x2] = cv2.matchTemplate(roi, template, cv2.TM_CCOEFF_NORMED)
+
+    return result
+
 def wait_for_image(
     device_id: str,
     template_name: str,
@@ -194,6 +372,51 @@ def wait_for_image(
         time.sleep(interval)
     return None
 
+def wait_for_screen_settle(
+    device_id: str,
+    region: Tuple[int, int, int, int] = None,
+    timeout: float = 1.0,
+    interval: float = 0.05,
+    max_diff: float = 2.0
+) -> Optional[np.ndarray]:
+    """Wait until the screen, or a region of it, stops changing
+
+    Consecutive screenshots are compared until their mean absolute grayscale difference
+    in region drops to max_diff or timeout expires.
+
+    Args:
+        device_id: Device identifier
+        region: Optional (x1, y1, x2, y2) region to compare, the whole screen if None
+        timeout: Maximum time to wait in seconds
+        interval: Pause between two screenshots in seconds
+        max_diff: Mean per pixel difference, out of 255, below which the screen is settled
+
+    Returns:
+        Last screenshot taken, or None if a screenshot failed
+    """
+    start_time = time.time()
+    previous = None
+    while True:
+        img = _take_and_load_screenshot(device_id)
+        if img is None:
+            return None
+
+        if region:
+            x1, y1, x2, y2 = region
+            current = to_grayscale(img[y1:y2, x1:x2])
+        else:
+            current = to_grayscale(img)
+
+        if previous is not None and cv2.absdiff(previous, current).mean() <= max_diff:
+            return img
+
+        if time.time() - start_time >= timeout:
+            app_logger.debug(f"Screen did not settle within {timeout}s")
+            return img
+
+        previous = current
+        time.sleep(interval)
+
 def compare_screenshots(img1: np.ndarray, img2: np.ndarray) -> bool:
     """
     Compare two screenshots to detect if they are nearly identical
@@ -211,6 +434,27 @@ def compare_screenshots(img1: np.ndarray, img2: np.ndarray) -> bool:
     # Use match_threshold from config for consistency with template matching
     return score >= CONFIG['match_threshold']
 
+def images_match(img1: np.ndarray, img2: np.ndarray, max_diff: float = 2.0) -> bool:
+    """Check whether two crops show the same pixels
+
+    Unlike compare_screenshots, which accepts anything correlated above match_threshold,
+    the crops must have the same size and a mean absolute grayscale difference of at
+    most max_diff, out of 255, so similar looking texts are told apart.
+    """
+    if img1 is None or img2 is None or img1.size == 0:
+        return False
+
+    if img1.shape != img2.shape:
+        return False
+
+    return cv2.absdiff(to_grayscale(img1), to_grayscale(img2)).mean() <= max_diff
+
+def _to_debug_image(img: np.ndarray) -> np.ndarray:
+    """Return a BGR copy of img that can be drawn on in color"""
+    if img.ndim == 2:
+        return cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+    return img.copy()
+
 def _save_debug_image(
     img: np.ndarray, 
     template_name: str,
@@ -220,7 +464,7 @@ def _save_debug_image(
 ) -> None:
     """Save debug image with matches and search region highlighted"""
     try:
-        debug_img = img.copy()
+        debug_img = _to_debug_image(img)
         
         # Draw search region if provided
         if search_region:
@@ -254,13 +498,21 @@ def find_and_tap_template(
     long_press: bool = False,
     press_duration: float = 1.0,
     critical: bool = False,
-    timeout: float = None
+    timeout: float = None,
+    image: Optional[np.ndarray] = None,
+    location: Optional[Tuple[int, int]] = None
 ) -> bool:
-    """Find and tap a template on screen"""
-    if timeout:
-        location = wait_for_image(device_id, template_name, timeout=timeout)
-    else:
-        location = find_template(device_id, template_name)
+    """Find and tap a template on screen
+
+    When image is provided and no timeout is set, the template is searched in that
+    screenshot instead of capturing a new one. When location is provided, the template
+    was already found there by the caller and is tapped without searching again.
+    """
+    if location is None:
+        if timeout:
+            location = wait_for_image(device_id, template_name, timeout=timeout)
+        else:
+            location = find_template(device_id, template_name, image=image)
     
     if location is None:
         if error_msg:
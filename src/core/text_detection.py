@@ -6,12 +6,13 @@ import pytesseract
 import re
 from typing import Tuple, Optional, Union, List, Dict, Any
 from .logging import app_logger
-from .device import take_screenshot, get_screen_size
+from .device import get_screen_size
 from .image_processing import _load_template, _take_and_load_screenshot, find_template, find_all_templates
 from .config import CONFIG
 from .debug import save_debug_region
 import numpy as np
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 debug = True
@@ -63,28 +64,19 @@ def get_text_regions(
     if y2 - y1 < min_height:
         y2 = min(height, y1 + min_height)
     
-    # Take screenshot and crop to search region
-    if not take_screenshot(device_id):
-        return (0, 0, 0, 0), (0, 0, 0, 0), None
-        
-    img = cv2.imread('tmp/screen.png')
-    if img is None:
-        return (0, 0, 0, 0), (0, 0, 0, 0), None
-        
-    # Crop image to search region
-    search_region = img[y1:y2, x1:x2]
-    
-    # Find brackets within cropped region
+    # Find brackets within search region of the same screenshot
     left_brackets = find_all_templates(
         device_id,
         "left_bracket",
-        search_region=(x1, y1, x2, y2)
+        search_region=(x1, y1, x2, y2),
+        image=img
     )
     
     right_brackets = find_all_templates(
         device_id,
         "right_bracket",
-        search_region=(x1, y1, x2, y2)
+        search_region=(x1, y1, x2, y2),
+        image=img
     )
     
     # Filter brackets by vertical alignment with accept button
@@ -130,7 +122,7 @@ def get_text_regions(
             min(height, y_center + y_padding)
         )
         
-        save_debug_region(device_id, alliance_region, "alliance")
+        save_debug_region(device_id, alliance_region, "alliance", img=img)
         return alliance_region, name_region, img
     
     # Fallback case with wider ratio
@@ -150,7 +142,7 @@ def get_text_regions(
     name_region = (split_x, y1, x2, y2)
     
     # Save debug image for fallback case too
-    save_debug_region(device_id, alliance_region, "alliance")
+    save_debug_region(device_id, alliance_region, "alliance", img=img)
     
     return alliance_region, name_region, img
 
@@ -158,11 +150,60 @@ def clean_text(text: str) -> str:
     """Strip non-alphanumeric characters from text"""
     return re.sub(r'[^a-zA-Z0-9]', '', text)
 
+# OCR with specific config for pixel font
+ALLIANCE_OCR_CONFIG = (
+    '--psm 7 '  # Single line mode
+    '--oem 1 '  # LSTM only
+    # f'-c tessedit_char_whitelist={ALLIANCE_CHARS}[] '
+    '-c tessedit_write_images=1 '
+    '-c textord_min_linesize=2 '
+    '-c edges_max_children_per_outline=40'
+)
+
+def _preprocess_alliance_region(cropped: np.ndarray) -> np.ndarray:
+    """Turn a cropped alliance tag into an enlarged binary image suited for OCR"""
+    # Convert to grayscale
+    gray = cv2.cvtColor(cropped, cv2.COLOR_BGR2GRAY)
+    
+    # Higher scale factor for better detail
+    scale = 8
+    enlarged = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+    
+    # Simple binary threshold
+    _, binary = cv2.threshold(enlarged, 127, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    
+    # Optional: Add slight dilation to connect components
+    kernel = np.ones((2,2), np.uint8)
+    return cv2.dilate(binary, kernel, iterations=1)
+
+def _parse_alliance_text(text: str) -> str:
+    """Extract the alliance tag from raw OCR text"""
+    # Clean up text but preserve case
+    text = text.replace('—', '').replace('–', '').strip()
+    
+    # Try to extract text between brackets first
+    bracket_match = re.search(r'[\[|(]{0,1}([^]|)]+)[]|)]{0,1}', text)
+    if bracket_match:
+        return bracket_match.group(1)
+        
+    # If no brackets, look for 3-4 letter sequences that match alliance patterns
+    words = re.findall(r'[A-Za-z0-9]{3,4}', text)
+    if words:
+        # Take first word that matches length of known alliances
+        for word in words:
+            if len(word) in {3, 4}:  # Most alliance tags are 3-4 chars
+                return word
+    
+    return ""
+
+def _read_alliance_text(binary: np.ndarray) -> Tuple[str, str]:
+    """OCR a preprocessed alliance tag and return (alliance, original OCR text)"""
+    original_text = pytesseract.image_to_string(binary, lang='eng', config=ALLIANCE_OCR_CONFIG).strip()
+    return _parse_alliance_text(original_text), original_text
+
 def extract_text_from_region(device_id: str, region: Tuple[int, int, int, int], languages: Union[str, List[str]] = 'eng', img: Optional[np.ndarray] = None) -> str:
     if img is None:
-        if not take_screenshot(device_id):
-            return "", ""
-        img = cv2.imread('tmp/screen.png')
+        img = _take_and_load_screenshot(device_id)
         if img is None:
             return "", ""
     
@@ -170,58 +211,57 @@ def extract_text_from_region(device_id: str, region: Tuple[int, int, int, int],
     cropped = img[y1:y2, x1:x2]
     
     if languages == 'eng':
-        # Convert to grayscale
-        gray = cv2.cvtColor(cropped, cv2.COLOR_BGR2GRAY)
-        
-        # Higher scale factor for better detail
-        scale = 8
-        enlarged = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
-        
-        # Simple binary threshold
-        _, binary = cv2.threshold(enlarged, 127, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        
-        # Optional: Add slight dilation to connect components
-        kernel = np.ones((2,2), np.uint8)
-        binary = cv2.dilate(binary, kernel, iterations=1)
+        binary = _preprocess_alliance_region(cropped)
         
         # Save debug images
         cv2.imwrite('tmp/debug_alliance_original.png', cropped)
         cv2.imwrite('tmp/debug_alliance_processed.png', binary)
         
-        # OCR with specific config for pixel font
-        config = (
-            '--psm 7 '  # Single line mode
-            '--oem 1 '  # LSTM only
-            # f'-c tessedit_char_whitelist={ALLIANCE_CHARS}[] '
-            '-c tessedit_write_images=1 '
-            '-c textord_min_linesize=2 '
-            '-c edges_max_children_per_outline=40'
-        )
-        text = pytesseract.image_to_string(binary, lang=languages, config=config).strip()
-        original_text = text
+        return _read_alliance_text(binary)
         
-        # Clean up text but preserve case
-        text = text.replace('—', '').replace('–', '').strip()
-        
-        # Try to extract text between brackets first
-        bracket_match = re.search(r'[\[|(]{0,1}([^]|)]+)[]|)]{0,1}', text)
-        if bracket_match:
-            return bracket_match.group(1), original_text
-            
-        # If no brackets, look for 3-4 letter sequences that match alliance patterns
-        words = re.findall(r'[A-Za-z0-9]{3,4}', text)
-        if words:
-            # Take first word that matches length of known alliances
-            for word in words:
-                if len(word) in {3, 4}:  # Most alliance tags are 3-4 chars
-                    return word, original_text
-        
-        return "", original_text
-        
-    return "", original_text
+    return "", ""
+
+def extract_texts_from_regions(
+    device_id: str,
+    regions: List[Tuple[int, int, int, int]],
+    languages: Union[str, List[str]] = 'eng',
+    img: Optional[np.ndarray] = None
+) -> List[Tuple[str, str]]:
+    """Extract text from several regions of the same screenshot concurrently
+
+    Each pytesseract call runs Tesseract in its own subprocess, so the threads wait on
+    separate processes and the OCR of all regions overlaps. No debug images are saved,
+    log_rejected_alliance rebuilds them from the screenshot when needed.
+
+    Returns:
+        List of (text, original OCR text) tuples, in the same order as regions
+    """
+    if not regions:
+        return []
 
-def log_rejected_alliance(alliance_text: str, original_text: str = ""):
-    """Log rejected alliance names to a file and store debug images"""
+    if languages != 'eng':
+        return [("", "")] * len(regions)
+
+    if img is None:
+        img = _take_and_load_screenshot(device_id)
+        if img is None:
+            return [("", "")] * len(regions)
+
+    binaries = [_preprocess_alliance_region(img[y1:y2, x1:x2]) for x1, y1, x2, y2 in regions]
+    with ThreadPoolExecutor(max_workers=min(len(binaries), os.cpu_count() or 1)) as executor:
+        return list(executor.map(_read_alliance_text, binaries))
+
+def log_rejected_alliance(
+    alliance_text: str,
+    original_text: str = "",
+    screenshot: Optional[np.ndarray] = None,
+    region: Optional[Tuple[int, int, int, int]] = None
+):
+    """Log rejected alliance names to a file and store debug images
+
+    When both screenshot and alliance region are given, the alliance debug images
+    are rebuilt from them instead of copying the last ones saved in tmp.
+    """
     from datetime import datetime
     import shutil
     
@@ -238,20 +278,41 @@ def log_rejected_alliance(alliance_text: str, original_text: str = ""):
             f.write(f"    Original OCR text: {original_text}\n")
             f.write(f"    Debug files: {reject_dir}/\n\n")
             
-        # Copy debug images if they exist
-        debug_files = {
-            'processed': 'tmp/debug_alliance_processed.png',
-            'original': 'tmp/debug_alliance_original.png',
-            'region': 'tmp/debug_alliance.png',
-            'full': 'tmp/debug_alliance_full.png',
-            'screen': 'tmp/screen.png'
-        }
-        
-        for img_type, src_path in debug_files.items():
-            if os.path.exists(src_path):
+        if screenshot is not None and region is not None:
+            # Rebuild the alliance debug images for this applicant, the ones in tmp may
+            # belong to another row when regions were computed in a batch
+            x1, y1, x2, y2 = region
+            cropped = screenshot[y1:y2, x1:x2]
+            full = screenshot.copy()
+            cv2.rectangle(full, (x1, y1), (x2, y2), (0, 255, 0), 2)
+            debug_images = {
+                'processed': _preprocess_alliance_region(cropped),
+                'original': cropped,
+                'region': cropped,
+                'full': full
+            }
+            for img_type, debug_img in debug_images.items():
                 dst_path = f'{reject_dir}/{img_type}.png'
-                shutil.copy2(src_path, dst_path)
+                cv2.imwrite(dst_path, debug_img)
                 app_logger.debug(f"Saved {img_type} image to {dst_path}")
+        else:
+            # Copy debug images if they exist
+            debug_files = {
+                'processed': 'tmp/debug_alliance_processed.png',
+                'original': 'tmp/debug_alliance_original.png',
+                'region': 'tmp/debug_alliance.png',
+                'full': 'tmp/debug_alliance_full.png'
+            }
+            
+            for img_type, src_path in debug_files.items():
+                if os.path.exists(src_path):
+                    dst_path = f'{reject_dir}/{img_type}.png'
+                    shutil.copy2(src_path, dst_path)
+                    app_logger.debug(f"Saved {img_type} image to {dst_path}")
+
+        # Screenshots are kept in memory, so the full screen is written directly
+        if screenshot is not None:
+            cv2.imwrite(f'{reject_dir}/screen.png', screenshot)
                 
     except Exception as e:
         app_logger.error(f"Failed to log rejected alliance: {e}")
@@ -280,5 +341,8 @@ CONTROL_LIST = CONFIG.get('control_list', {
     "blacklist": {"alliance": []}
 })
 
-__all__ = ['CONTROL_LIST', 'ALLIANCE_CHARS', 'extract_text_from_region', 
-           'get_text_regions', 'log_rejected_alliance'] 
\ No newline at end of file
+# Whitelisted alliance tags as a set for constant time membership checks
+ALLIANCE_WHITELIST = frozenset(CONTROL_LIST.get('whitelist', {}).get('alliance', []))
+
+__all__ = ['CONTROL_LIST', 'ALLIANCE_CHARS', 'ALLIANCE_WHITELIST', 'extract_text_from_region', 
+           'extract_texts_from_regions', 'get_text_regions', 'log_rejected_alliance'] 
\ No newline at end of file